@@ -1,188 +1,381 @@
 import os
-from typing import Dict, Any, Tuple
-from collections import defaultdict
+import stat
+import sys
+from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from heapq import heappush, heappushpop
 import utils
 import navigation
 import local as lcl
 
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PARALLEL_THRESHOLD = 4
+MAX_PENDING = MAX_WORKERS * 4
+TOP_FILES_LIMIT = 10
+# Distinct raw extensions whose lowercased form is kept
+EXTENSION_CACHE_SIZE = 1024
 
-def count_files(path: str) -> Tuple[bool, int]:
+
+def _new_stats() -> Dict[str, Any]:
     """
-    Recursive counting of all files in the Windows directory.
+    Creates an empty statistics accumulator for the directory walk.
+
+    Returns:
+        Dict[str, Any]: Dictionary with zeroed counters.
+    """
+
+    return {
+        "files": 0,
+        "bytes": 0,
+        "type_counts": Counter(),
+        "type_sizes": Counter(),
+        "attributes": {"hidden": 0, "system": 0, "readonly": 0},
+        "largest": [],
+    }
+
+
+@lru_cache(maxsize=EXTENSION_CACHE_SIZE)
+def _normalize_extension(extension: str) -> str:
+    """
+    Returns the interned, lowercased form of a raw extension.
 
     Args:
-        path (str): The path to the analyzed directory.
+        extension (str): Extension as it appears in the name, without the dot.
 
     Returns:
-        Tuple[bool, int]: Tuple, where:
-         - bool: Operation success (True/False)
-         - int: Total number of files in the directory and subdirectories.
+        str: The extension, e.g. ".txt".
     """
 
-    try:
-        validity, items = navigation.list_directory(path)
-        if not validity or not items:
-            return False, 0
+    return sys.intern('.' + extension.lower())
 
-        count = 0
 
-        for item in items:
-            full_path = os.path.join(path, item["name"])
+def _file_extension(name: str) -> str:
+    """
+    Returns the lowercased extension of a file name.
 
-            if item['type'] == 'file':
-                count += 1
-            elif item['type'] == 'folder' and not item.get('hidden', False):
-                success_sub, count_sub = count_files(full_path)
-                if success_sub:
-                    count += count_sub
+    Matches os.path.splitext (leading dots do not start an extension)
+    without its generic separator handling. Names without an extension
+    get ".noext". Results are cached by the raw extension and interned,
+    so the statistics dictionaries hash and compare the same few strings.
 
-        return True, count
+    Args:
+        name (str): The file name.
 
-    except Exception as e:
-        print(f"{lcl.ERROR_COUNTING_FILES} {path}: {e}")
-        return False, 0
+    Returns:
+        str: The extension, e.g. ".txt".
+    """
 
+    _, dot, extension = name.lstrip('.').rpartition('.')
+    if not dot:
+        return ".noext"
 
-def count_bytes(path: str) -> Tuple[bool, int]:
+    return _normalize_extension(extension)
+
+
+def _types_table(statistic: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
-    Recursive calculation of the total size of files in the Windows directory.
+    Builds the per-extension table from the walk accumulator.
 
     Args:
-        path (str): The path to the analyzed directory.
+        statistic (Dict[str, Any]): Accumulator filled by the walk.
 
     Returns:
-        Tuple[bool, int]: Tuple, where:
+        Dict[str, Dict[str, Any]]: Extension statistics with keys
+        'count' and 'size' for every extension.
+    """
+
+    sizes = statistic["type_sizes"]
+    return {
+        ext: {"count": count, "size": sizes[ext]}
+        for ext, count in statistic["type_counts"].items()
+    }
+
+
+def _push_largest(largest: List[Tuple[int, str]], entry: Tuple[int, str]) -> None:
+    """
+    Adds a file to the min-heap of the largest files (at most TOP_FILES_LIMIT).
+
+    Args:
+        largest (List[Tuple[int, str]]): Heap of (size, path) pairs.
+        entry (Tuple[int, str]): The (size, path) pair of the file.
+    """
+
+    if len(largest) < TOP_FILES_LIMIT:
+        heappush(largest, entry)
+    else:
+        heappushpop(largest, entry)
+
+
+def _merge_stats(statistic: Dict[str, Any], subdir_stats: Dict[str, Any]) -> None:
+    """
+    Adds the statistics collected by a worker to the main accumulator.
+
+    Args:
+        statistic (Dict[str, Any]): Main accumulator (updated in place).
+        subdir_stats (Dict[str, Any]): Statistics collected by the worker.
+    """
+
+    statistic["files"] += subdir_stats["files"]
+    statistic["bytes"] += subdir_stats["bytes"]
+
+    statistic["type_counts"].update(subdir_stats["type_counts"])
+    statistic["type_sizes"].update(subdir_stats["type_sizes"])
+
+    for key in statistic["attributes"]:
+        statistic["attributes"][key] += subdir_stats["attributes"][key]
+
+    for entry in subdir_stats["largest"]:
+        _push_largest(statistic["largest"], entry)
+
+
+def _scan_directory(
+    path: str,
+    visible: bool,
+    statistic: Dict[str, Any],
+    items: Optional[List[navigation.DirectoryEntry]] = None
+) -> Tuple[bool, List[Tuple[str, bool]]]:
+    """
+    Lists one directory and adds its files to the statistics accumulator.
+
+    Args:
+        path (str): The path to the scanned directory.
+        visible (bool): False if the directory is inside a hidden folder.
+        statistic (Dict[str, Any]): Accumulator (updated in place).
+        items (List[DirectoryEntry], optional): Entries of the directory
+            already returned by navigation.list_directory().
+
+    Returns:
+        Tuple[bool, List[Tuple[str, bool]]]: Tuple, where:
          - bool: Operation success (True/False)
-         - int: The total size of all files in bytes.
+         - List: Subdirectories to scan as (path, visible) pairs.
     """
 
+    subdirs: List[Tuple[str, bool]] = []
+
     try:
-        validity, items = navigation.list_directory(path)
-        if not validity:
-            return False, 0
+        if items is None:
+            validity, items = navigation.list_directory(path)
+            if not validity:
+                return False, subdirs
+
+        base = path if path.endswith(os.sep) else path + os.sep
 
-        count = 0
+        # Per-directory batches: extension counts are added with one
+        # C-level Counter.update call instead of an increment per file.
+        extensions: List[str] = []
+        type_sizes = statistic["type_sizes"]
+        attributes = statistic["attributes"]
+        largest = statistic["largest"]
+        directory_bytes = 0
 
         for item in items:
-            full_path = os.path.join(path, item["name"])
+            # Reparse points (symbolic links, junctions) are not followed:
+            # their targets are counted where they actually live.
+            if item.is_link or item.is_junction:
+                continue
+
+            if item.is_dir:
+                subdirs.append((base + item.name, visible and not item.hidden))
+                continue
+
+            # The size comes from the directory listing itself;
+            # no additional stat is needed here.
+            size = item.size
+
+            extension = _file_extension(item.name)
+            extensions.append(extension)
+            type_sizes[extension] += size
+            directory_bytes += size
+
+            if not visible:
+                continue
+
+            # The full path is only built for files that may enter the
+            # heap. Ties are kept by the heap's (size, path) order, so the
+            # result does not depend on the order directories are listed.
+            if len(largest) < TOP_FILES_LIMIT or size >= largest[0][0]:
+                _push_largest(largest, (size, base + item.name))
+
+            if item.hidden:
+                attributes["hidden"] += 1
 
-            if item['type'] == 'file':
-                count += item.get('size', 0)
-            elif item['type'] == 'folder' and not item.get('hidden', False):
-                success_sub, count_sub = count_bytes(full_path)
-                if success_sub:
-                    count += count_sub
+            if item.attrs & stat.FILE_ATTRIBUTE_READONLY:
+                attributes["readonly"] += 1
 
-        return True, count
+            # pagefile.sys, hiberfil.sys and swapfile.sys are all covered
+            # by the extension check.
+            if item.attrs & stat.FILE_ATTRIBUTE_SYSTEM or extension == ".sys":
+                attributes["system"] += 1
+
+        statistic["type_counts"].update(extensions)
+        if visible:
+            statistic["files"] += len(extensions)
+            statistic["bytes"] += directory_bytes
+
+        return True, subdirs
 
     except Exception as e:
-        print(f"{lcl.ERROR_COUNTING_SIZE} {path}: {e}")
-        return False, 0
+        print(f"{lcl.ERROR_COLLECTING_STATS} {path}: {e}")
+        return False, subdirs
 
 
-def analyze_windows_file_types(path: str) -> Tuple[bool,Dict[str, Dict[str, Any]]]:
+def _scan_task(
+    path: str,
+    visible: bool
+) -> Tuple[Dict[str, Any], List[Tuple[str, bool]]]:
     """
-    Analyzes file types by extensions in the Windows directory.
+    Scans one directory into its own accumulator (run in a worker thread).
+
+    Args:
+        path (str): The path to the scanned directory.
+        visible (bool): False if the directory is inside a hidden folder.
+
+    Returns:
+        Tuple[Dict[str, Any], List[Tuple[str, bool]]]: Tuple, where:
+         - Dict: Statistics of the directory itself
+         - List: Subdirectories to scan as (path, visible) pairs.
+    """
+
+    statistic = _new_stats()
+    _, subdirs = _scan_directory(path, visible, statistic)
+    return statistic, subdirs
+
+
+def _walk_collect(
+    path: str,
+    items: Optional[List[navigation.DirectoryEntry]] = None
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Single walk collecting all statistics of the Windows directory.
+
+    Each directory is listed only once; files, sizes, extensions and
+    attributes are accumulated in the same pass. Files inside hidden
+    folders are taken into account only in the extension statistics.
+    Subdirectories are kept on an explicit stack, so deep trees
+    do not hit the recursion limit. When more than PARALLEL_THRESHOLD
+    directories are pending, they are listed concurrently in a thread
+    pool (listing is IO-bound and releases the GIL); from then on
+    discovered subdirectories are handed to the pool as slots free up.
 
     Args:
         path (str): The path to the analyzed directory.
+        items (List[DirectoryEntry], optional): Entries of the root
+            directory, if the caller has already listed it.
 
     Returns:
-        Tuple[bool, Dict[str, Dict[str, Any]]]: Tuple, where:
+        Tuple[bool, Dict[str, Any]]: Tuple, where:
          - bool: Operation success (True/False)
-         - Dict: Extension statistics, where the key is the extension,
-           value is a dictionary with keys:
-            - 'count': the number of files with this extension
-            - 'size': the total size of files with this extension
+         - Dict: Statistics with keys 'files', 'bytes', 'type_counts',
+           'type_sizes', 'attributes' and 'largest' (heap of (size, path)
+           pairs of the largest files).
     """
 
-    statistic = defaultdict(lambda: {"count": 0, "size": 0})
+    statistic = _new_stats()
 
-    try:
-        validity, items = navigation.list_directory(path)
-        if not validity:
-            return False, {}
+    success, subdirs = _scan_directory(path, True, statistic, items)
+    stack = deque(subdirs)
 
-        for item in items:
-            full_path = os.path.join(path, item["name"])
-
-            if item["type"] == "folder":
-                success, subdir_stats = analyze_windows_file_types(full_path)
-                if success:
-                    for ext, data in subdir_stats.items():
-                        statistic[ext]["count"] += data["count"]
-                        statistic[ext]["size"] += data["size"]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        running: Set[Future] = set()
+
+        while stack or running:
+            if not running and len(stack) <= PARALLEL_THRESHOLD:
+                current, visible = stack.pop()
+                _, subdirs = _scan_directory(current, visible, statistic)
+                stack.extend(subdirs)
                 continue
 
-            if item["type"] == "file":
-                filename, extension = os.path.splitext(item["name"])
-                extension = extension.lower()
+            # Subdirectories are submitted as soon as their parent is
+            # listed, so a slow directory never holds back the others.
+            # Only MAX_PENDING listings are in flight, since wait() walks
+            # over every pending future on each call.
+            while stack and len(running) < MAX_PENDING:
+                current, visible = stack.pop()
+                running.add(pool.submit(_scan_task, current, visible))
 
-                if not extension:
-                    extension = ".noext"
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdir_stats, subdirs = future.result()
+                _merge_stats(statistic, subdir_stats)
+                stack.extend(subdirs)
 
-                size = item.get("size", 0)
+    return success, statistic
 
-                statistic[extension]["count"] += 1
-                statistic[extension]["size"] += size
 
-        return True, dict(statistic)
+def count_files(path: str) -> Tuple[bool, int]:
+    """
+    Recursive counting of all files in the Windows directory.
 
-    except Exception as e:
-        print(f"{lcl.ERROR_ANALYZING_TYPES} {path}: {e}")
-        return False, {}
+    Args:
+        path (str): The path to the analyzed directory.
 
+    Returns:
+        Tuple[bool, int]: Tuple, where:
+         - bool: Operation success (True/False)
+         - int: Total number of files in the directory and subdirectories.
+    """
 
-def get_windows_file_attributes_stats(path: str) -> Dict[str, int]:
+    success, statistic = _walk_collect(path)
+    return success, statistic["files"]
+
+
+def count_bytes(path: str) -> Tuple[bool, int]:
     """
-    Collects statistics on attributes of Windows files in a directory.
+    Recursive calculation of the total size of files in the Windows directory.
 
     Args:
         path (str): The path to the analyzed directory.
 
     Returns:
-        Dict[str, int]: Dictionary with statistics on attributes:
-            - 'hidden': the number of hidden files
-            - 'system': number of system files
-            - 'readonly': number of read-only files
+        Tuple[bool, int]: Tuple, where:
+         - bool: Operation success (True/False)
+         - int: The total size of all files in bytes.
     """
 
-    statistic = {"hidden": 0, "system": 0, "readonly": 0}
+    success, statistic = _walk_collect(path)
+    return success, statistic["bytes"]
 
-    try:
-        success, items = navigation.list_directory(path)
-        if not success or not items:
-            return statistic
 
-        for item in items:
-            full_path = os.path.join(path, item["name"])
+def analyze_windows_file_types(path: str) -> Tuple[bool,Dict[str, Dict[str, Any]]]:
+    """
+    Analyzes file types by extensions in the Windows directory.
 
-            if item["type"] == "file":
-                if item.get("hidden", False):
-                    statistic["hidden"] += 1
+    Args:
+        path (str): The path to the analyzed directory.
 
-                try:
-                    if not os.access(full_path, os.W_OK):
-                        statistic["readonly"] += 1
-                except (PermissionError, OSError):
-                    pass
+    Returns:
+        Tuple[bool, Dict[str, Dict[str, Any]]]: Tuple, where:
+         - bool: Operation success (True/False)
+         - Dict: Extension statistics, where the key is the extension,
+           value is a dictionary with keys:
+            - 'count': the number of files with this extension
+            - 'size': the total size of files with this extension
+    """
 
-                filename_lower = item["name"].lower()
-                if filename_lower.endswith('.sys') or filename_lower in [
-                    'pagefile.sys', 'hiberfil.sys', 'swapfile.sys'
-                ]:
-                    statistic["system"] += 1
+    success, statistic = _walk_collect(path)
+    if not success:
+        return False, {}
+    return True, _types_table(statistic)
 
-            elif item["type"] == "folder" and not item.get("hidden", False):
-                subdir_stats = get_windows_file_attributes_stats(full_path)
-                for key in statistic:
-                    statistic[key] += subdir_stats.get(key, 0)
 
-        return statistic
+def get_windows_file_attributes_stats(path: str) -> Dict[str, int]:
+    """
+    Collects statistics on attributes of Windows files in a directory.
 
-    except Exception as e:
-        print(f"{lcl.ERROR_ANALYZING_ATTRS} {path}: {e}")
-        return statistic
+    Args:
+        path (str): The path to the analyzed directory.
+
+    Returns:
+        Dict[str, int]: Dictionary with statistics on attributes:
+            - 'hidden': the number of hidden files
+            - 'system': number of system files
+            - 'readonly': number of read-only files
+    """
+
+    _, statistic = _walk_collect(path)
+    return statistic["attributes"]
 
 
 def show_windows_directory_stats(path: str) -> bool:
@@ -200,7 +393,7 @@ def show_windows_directory_stats(path: str) -> bool:
         1. General information (number of files, total size)
         2. Statistics on file types (extensions)
         3. Statistics on file attributes
-        4. List of the largest files in the current directory
+        4. List of the largest files in the directory and subdirectories
     """
 
     print(f"\n{'='*60}")
@@ -208,78 +401,77 @@ def show_windows_directory_stats(path: str) -> bool:
     print(f"{'='*60}\n")
 
 
-    print(f"\n{lcl.SECTION_GENERAL}")
-    print("-" * 40)
+    validity, items = navigation.list_directory(path)
+    success, statistic = _walk_collect(path, items if validity else None)
 
-    success_files, total_files = count_files(path)
-    if success_files:
-        print(f"{lcl.TOTAL_FILES} {total_files:,}")
-    else:
-        print(f"{lcl.ERROR_COUNTING}")
+    # The report is assembled first and written to the console at once.
+    lines: List[str] = []
+
+    lines.append(f"\n{lcl.SECTION_GENERAL}")
+    lines.append("-" * 40)
 
-    success_size, total_bytes = count_bytes(path)
-    if success_size:
-        print(f"{lcl.TOTAL_SIZE} {utils.format_size(total_bytes)}")
+    if success:
+        lines.append(f"{lcl.TOTAL_FILES} {statistic['files']:,}")
+        lines.append(f"{lcl.TOTAL_SIZE} {utils.format_size(statistic['bytes'])}")
     else:
-        print(f"{lcl.ERROR_SIZES}")
+        lines.append(f"{lcl.ERROR_COUNTING}")
+        lines.append(f"{lcl.ERROR_SIZES}")
 
 
-    print(f"\n{lcl.SECTION_FILE_TYPES}")
-    print("-" * 40)
+    lines.append(f"\n{lcl.SECTION_FILE_TYPES}")
+    lines.append("-" * 40)
 
-    success_types, ext_stats = analyze_windows_file_types(path)
-    if success_types and ext_stats:
-        print(f"{lcl.FOUND} {len(ext_stats)} {lcl.DIFFERENT_EXT}")
-        print()
+    ext_stats = _types_table(statistic)
+    if success and ext_stats:
+        lines.append(f"{lcl.FOUND} {len(ext_stats)} {lcl.DIFFERENT_EXT}")
+        lines.append("")
 
-        for extension, data in sorted(
-                ext_stats.items(),
-                key=lambda x: -x[1]["count"]):
-            print(f"  {extension:10}  {data['count']:5} {lcl.FILES},"
-                  f" {utils.format_size(data['size'])}")
-    else:
-        print(f"{lcl.ERROR_EXTENSIONS}")
+        rows = [
+            (-data["count"], extension, data["size"])
+            for extension, data in ext_stats.items()
+        ]
+        rows.sort()
 
+        for neg_count, extension, size in rows:
+            lines.append(f"  {extension:10}  {-neg_count:5} {lcl.FILES},"
+                         f" {utils.format_size(size)}")
+    else:
+        lines.append(f"{lcl.ERROR_EXTENSIONS}")
 
-    print(f"\n{lcl.SECTION_ATTRIBUTES}")
-    print("-" * 40)
 
-    attrs = get_windows_file_attributes_stats(path)
-    print(f"{lcl.HIDDEN_FILES}            {attrs['hidden']:>8,}")
-    print(f"{lcl.SYSTEM_FILES}          {attrs['system']:>8,}")
-    print(f"{lcl.READONLY_FILES}  {attrs['readonly']:>8,}")
+    lines.append(f"\n{lcl.SECTION_ATTRIBUTES}")
+    lines.append("-" * 40)
 
+    attrs = statistic["attributes"]
+    lines.append(f"{lcl.HIDDEN_FILES}            {attrs['hidden']:>8,}")
+    lines.append(f"{lcl.SYSTEM_FILES}          {attrs['system']:>8,}")
+    lines.append(f"{lcl.READONLY_FILES}  {attrs['readonly']:>8,}")
 
-    print(f"\n{lcl.SECTION_LARGEST_FILES}")
-    print("-" * 40)
 
-    success, items = navigation.list_directory(path)
-    if success and items:
-        files = []
-        for item in items:
-            if item["type"] == "file":
-                files.append((item["name"], item.get("size", 0)))
+    lines.append(f"\n{lcl.SECTION_LARGEST_FILES}")
+    lines.append("-" * 40)
 
-        if files:
-            files.sort(key=lambda x: x[1], reverse=True)
-            top_files = files[:10]
+    if success and statistic["largest"]:
+        top_files = sorted(statistic["largest"], reverse=True)
 
-            print(f"{lcl.FOUND} {len(files)} {lcl.FILES}, {lcl.TOP} {len(top_files)} {lcl.BY_SIZE}\n")
+        lines.append(f"{lcl.FOUND} {statistic['files']:,} {lcl.FILES}, {lcl.TOP} {len(top_files)} {lcl.BY_SIZE}\n")
 
-            for i, (name, size) in enumerate(top_files, 1):
-                display_name = name
-                if len(name) > 35:
-                    display_name = name[:32] + "..."
+        for i, (size, file_path) in enumerate(top_files, 1):
+            display_name = os.path.relpath(file_path, path)
+            if len(display_name) > 35:
+                display_name = display_name[:32] + "..."
 
-                print(f"{i:2}. {display_name:35} {utils.format_size(size):>10}")
-        else:
-            print(f"{lcl.NO_FILES}")
+            lines.append(f"{i:2}. {display_name:35} {utils.format_size(size):>10}")
+    elif success:
+        lines.append(f"{lcl.NO_FILES}")
     else:
-        print(f"{lcl.CANNOT_LIST}")
+        lines.append(f"{lcl.CANNOT_LIST}")
+
+    lines.append("\n" + "=" * 60)
+    lines.append(f"{lcl.ANALYSIS_COMPLETE}")
+    lines.append("=" * 60)
 
-    print("\n" + "=" * 60)
-    print(f"{lcl.ANALYSIS_COMPLETE}")
-    print("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    return success_files and success_size and success_types
+    return success
     
@@ -92,7 +92,7 @@ FILE_NAME = '''Имя файла'''
 SIZE = '''Размер (МБ)'''
 TYPE = '''Тип'''
 NOT_FILES = '''Файлы не найдены.'''
-SYSTEM_FILES = '''Обнаружено системных файлов: '''
+SYSTEM_FILES_FOUND = '''Обнаружено системных файлов: '''
 SHOW_STATISTIC = '''Показ статистики текущей папки:'''
 EX_INPUT = '''Введите расширения через запятую (например: txt, pdf, exe): '''
 FILES_SIZE = '''файлов с расширениями'''
@@ -117,10 +117,7 @@ FILES_2 = '''файлов по шаблону'''
 
 #ANALYSIS
 
-ERROR_COUNTING_FILES = '''Ошибка при подсчете файлов в'''
-ERROR_COUNTING_SIZE = '''Ошибка при подсчете размера в'''
-ERROR_ANALYZING_TYPES = '''Ошибка анализа типов файлов в'''
-ERROR_ANALYZING_ATTRS = '''Ошибка при анализе атрибутов в'''
+ERROR_COLLECTING_STATS = '''Ошибка при сборе статистики в'''
 
 STATS_TITLE = '''Статистика каталога:'''
 SECTION_GENERAL = '''1. ОБЩАЯ ИНФОРМАЦИЯ'''
@@ -7,6 +7,19 @@ import analysis
 import search
 import local as lcl
 
+MAIN_MENU = "\n".join((
+    lcl.COMMANDS,
+    lcl.FIRST,
+    lcl.SECOND,
+    lcl.THIRD,
+    lcl.FORTH,
+    lcl.FIFTH,
+    lcl.SIXTH,
+    lcl.SEVENTH,
+    lcl.EIGHTTH,
+    lcl.ZERO,
+))
+
 
 def check_windows_environment() -> bool:
     """Checks that the program is running on Windows.
@@ -80,16 +93,7 @@ def display_main_menu(current_path: str) -> None:
 
     print(f'\n{lcl.DIRECTORY} {current_path}')
     print("-" * 70)
-    print(f'{lcl.COMMANDS}')
-    print(f'{lcl.FIRST}')
-    print(f'{lcl.SECOND}')
-    print(f'{lcl.THIRD}')
-    print(f'{lcl.FORTH}')
-    print(f'{lcl.FIFTH}')
-    print(f'{lcl.SIXTH}')
-    print(f'{lcl.SEVENTH}')
-    print(f'{lcl.EIGHTTH}')
-    print(f'{lcl.ZERO}')
+    print(MAIN_MENU)
     print("-" * 70)
 
 
@@ -189,9 +193,11 @@ def handle_windows_analysis(command: str, current_path: str) -> None:
         if success:
             print(f'\n{lcl.STATISTIC}')
             print("-" * 50)
-            for ext, data in sorted(stats.items(), key=lambda x: -x[1]["size"]):
+            rows = [(-data["size"], ext, data["count"]) for ext, data in stats.items()]
+            rows.sort()
+            for neg_size, ext, count in rows:
                 if ext:
-                    print(f"{ext:10} : {data['count']:4}" f'{lcl.FILE}', f"{utils.format_size(data['size'])}")
+                    print(f"{ext:10} : {count:4}" f'{lcl.FILE}', f"{utils.format_size(-neg_size)}")
             print("-" * 50)
         else:
             print(f'{lcl.ERROR1}')
@@ -212,6 +218,39 @@ def handle_windows_search(command: str, current_path: str) -> None:
         search.search_menu_handler(current_path)
 
 
+def handle_windows_listing(command: str, current_path: str) -> None:
+    """Handles the directory listing command.
+
+    Args:
+        command (str): User command.
+        current_path (str): Current working directory.
+
+    Returns:
+        None
+    """
+
+    print(f'\n{lcl.DIRECTORY1}' f"{current_path}")
+    success, items = navigation.list_directory(current_path)
+    if success:
+        navigation.format_directory_output(items)
+    else:
+        print(f'{lcl.DIRECTORY_ERROR}')
+
+
+# Command -> handler(command, current_path); handlers that change the
+# directory return the new path, the others return None.
+COMMAND_HANDLERS = {
+    "1": handle_windows_listing,
+    "2": handle_windows_analysis,
+    "3": handle_windows_search,
+    "4": handle_windows_analysis,
+    "5": handle_windows_navigation,
+    "6": handle_windows_navigation,
+    "7": handle_windows_navigation,
+    "8": handle_windows_navigation,
+}
+
+
 def run_windows_command(command: str, current_path: str) -> str:
     """Main Windows command dispatcher.
 
@@ -223,34 +262,16 @@ def run_windows_command(command: str, current_path: str) -> str:
             str: Updated working directory.
     """
 
-    new_path = current_path
-
-    match command:
-        case "1":
-            print(f'\n{lcl.DIRECTORY1}' f"{current_path}")
-            success, items = navigation.list_directory(current_path)
-            if success:
-                navigation.format_directory_output(items)
-            else:
-                print(f'{lcl.DIRECTORY_ERROR}')
-
-        case "2" | "4":
-            handle_windows_analysis(command, current_path)
-
-        case "3":
-            handle_windows_search(command, current_path)
-
-        case "5" | "6" | "7" | "8":
-            new_path = handle_windows_navigation(command, current_path)
-
-        case "0":
-            print(f'{lcl.EXIT}')
-            sys.exit(0)
+    if command == "0":
+        print(f'{lcl.EXIT}')
+        sys.exit(0)
 
-        case _:
-            print(f'{lcl.NO_COMMAND}')
+    handler = COMMAND_HANDLERS.get(command)
+    if handler is None:
+        print(f'{lcl.NO_COMMAND}')
+        return current_path
 
-    return new_path
+    return handler(command, current_path) or current_path
 
 
 def main() -> NoReturn:
@@ -1,9 +1,47 @@
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+import sys
+from typing import Dict, List, NamedTuple, Tuple
 import utils
 import local as lcl
 
+DRIVE_NO_ROOT_DIR = 1
+
+# The user profile does not change during a session
+if utils.is_windows_os():
+    USER_PROFILE = os.environ.get("USERPROFILE", "") or os.path.expanduser("~")
+else:
+    USER_PROFILE = os.path.expanduser("~")
+
+SPECIAL_FOLDERS: Dict[str, str] = {
+    "Desktop": os.path.join(USER_PROFILE, "Desktop"),
+    "Documents": os.path.join(USER_PROFILE, "Documents"),
+    "Downloads": os.path.join(USER_PROFILE, "Downloads"),
+}
+
+
+class DirectoryEntry(NamedTuple):
+    """
+    Directory entry returned by list_directory().
+
+    Attributes:
+        name (str): Entry name.
+        is_dir (bool): True for folders, False for files.
+        size (int): File size in bytes (0 for folders).
+        modified (float): Modification time as a POSIX timestamp.
+        hidden (bool): The entry is hidden.
+        attrs (int): Windows file attribute bits (0 on other systems).
+        is_link (bool): The entry is a symbolic link.
+        is_junction (bool): The entry is an NTFS junction point.
+    """
+    name: str
+    is_dir: bool
+    size: int
+    modified: float
+    hidden: bool
+    attrs: int
+    is_link: bool
+    is_junction: bool
+
 
 def get_current_drive() -> str:
     """
@@ -48,18 +86,20 @@ def list_available_drives() -> List[str]:
             print(f"Windows API error GetLogicalDrives: {lcl.CODE} {last_error}")
             return ["C:"]
 
+        get_drive_type = ctypes.windll.kernel32.GetDriveTypeW
+        get_drive_type.argtypes = [wintypes.LPCWSTR]
+        get_drive_type.restype = wintypes.UINT
+
         drives = []
 
         for i in range(26):
             if drives_bitmask & (1 << i):
                 drive_letter = f"{chr(65 + i)}:"
-                drive_path = drive_letter + "\\"
 
-                try:
-                    if os.path.exists(drive_path):
-                        drives.append(drive_letter)
-                except (PermissionError, OSError):
-                    continue
+                # GetDriveTypeW does not touch the media, unlike a stat of
+                # the drive root, which blocks on empty optical/card drives.
+                if get_drive_type(drive_letter + "\\") != DRIVE_NO_ROOT_DIR:
+                    drives.append(drive_letter)
 
         return drives if drives else ["C:"]
 
@@ -74,51 +114,64 @@ def list_available_drives() -> List[str]:
         return ["C:"]
 
 
-def list_directory(path: str) -> Tuple[bool, List[Dict[str, Any]]]:
+def _read_directory(path: str) -> List[DirectoryEntry]:
     """
-    List the contents of a directory in Windows.
+    Read the entries of a directory with os.scandir.
 
     Args:
         path (str): Path to the directory.
 
     Returns:
-        Tuple[bool, List[Dict[str, Any]]]: Tuple, where:
-         - bool: Operation success (True/False)
-         - List[Dict]: List of directory entries with metadata:
-           - name (str)
-           - type ("file" or "folder")
-           - size (int)
-           - modified (str, YYYY-MM-DD)
-           - hidden (bool)
-    """
-    entries: List[Dict[str, Any]] = []
+        List[DirectoryEntry]: Directory entries with metadata.
 
-    try:
-        items = utils.safe_windows_listdir(path)
+    Raises:
+        OSError: If the directory cannot be read.
+    """
+    entries: List[DirectoryEntry] = []
 
+    with os.scandir(path) as items:
         for item in items:
-            full_path = os.path.join(path, item)
+            is_dir = item.is_dir()
 
-            is_dir = os.path.isdir(full_path)
-            is_hidden = utils.is_hidden_windows_file(full_path)
+            # On Windows the stat result comes from the directory
+            # listing itself, so no extra syscall is made here.
+            item_stat = item.stat(follow_symlinks=False)
 
-            size = 0 if is_dir else os.path.getsize(full_path)
-            modified_time = datetime.fromtimestamp(
-                os.path.getmtime(full_path)
-            ).strftime("%Y-%m-%d")
+            # Windows attribute bits; other systems have none. The hidden
+            # check reads the same cached stat data, so there is no
+            # separate GetFileAttributesW call per entry.
+            attrs = getattr(item_stat, "st_file_attributes", 0)
 
             entries.append(
-                {
-                    "name": item,
-                    "type": "folder" if is_dir else "file",
-                    "size": size,
-                    "modified": modified_time,
-                    "hidden": is_hidden,
-                }
+                DirectoryEntry(
+                    name=item.name,
+                    is_dir=is_dir,
+                    size=0 if is_dir else item_stat.st_size,
+                    modified=item_stat.st_mtime,
+                    hidden=utils.is_hidden_from_entry(item),
+                    attrs=attrs,
+                    is_link=item.is_symlink(),
+                    is_junction=item.is_junction(),
+                )
             )
 
-        return True, entries
+    return entries
+
+
+def list_directory(path: str) -> Tuple[bool, List[DirectoryEntry]]:
+    """
+    List the contents of a directory in Windows.
+
+    Args:
+        path (str): Path to the directory.
 
+    Returns:
+        Tuple[bool, List[DirectoryEntry]]: Tuple, where:
+         - bool: Operation success (True/False)
+         - List[DirectoryEntry]: Directory entries with metadata.
+    """
+    try:
+        return True, _read_directory(path)
     except Exception:
         return False, []
 
@@ -133,38 +186,46 @@ def format_size(size_bytes: int) -> str:
     Returns:
         str: Formatted size (e.g. "10 MB").
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes} {unit}"
-        size_bytes /= 1024
+    # Each unit is 2**10 times the previous one, so the bit length of
+    # the size picks the unit directly; PB is the largest unit.
+    unit_index = min(max(0, (size_bytes.bit_length() - 1) // 10), len(utils.SIZE_UNITS) - 1)
+
+    if unit_index == 0:
+        return f"{size_bytes} B"
 
-    return f"{size_bytes:.2f} PB"
+    size = size_bytes / utils.SIZE_DIVISORS[unit_index]
+    if unit_index == len(utils.SIZE_UNITS) - 1:
+        return f"{size:.2f} {utils.SIZE_UNITS[unit_index]}"
 
+    return f"{size} {utils.SIZE_UNITS[unit_index]}"
 
-def format_directory_output(items: List[Dict[str, Any]]) -> None:
+
+def format_directory_output(items: List[DirectoryEntry]) -> None:
     """
     Print formatted directory contents to the console.
 
-nastya, [04.02.2026 0:21]
-Args:
-        items (List[Dict[str, Any]]): Directory entries returned
+    Args:
+        items (List[DirectoryEntry]): Directory entries returned
                                       by list_directory().
     """
     if not items:
         print(f"{lcl.EMPTY_DIRECTORY}")
         return
 
+    lines = []
     for item in items:
-        name = item["name"]
-        type_icon = "[D]" if item["type"] == "folder" else "[F]"
+        type_icon = "[D]" if item.is_dir else "[F]"
         size_str = (
-            format_size(item["size"])
-            if item["type"] == "file"
+            format_size(item.size)
+            if not item.is_dir
             else ""
         )
-        hidden_marker = f"{lcl.HIDDEN}" if item["hidden"] else ""
+        hidden_marker = f"{lcl.HIDDEN}" if item.hidden else ""
 
-        print(f"{type_icon} {name} {size_str} {hidden_marker}")
+        lines.append(f"{type_icon} {item.name} {size_str} {hidden_marker}")
+
+    # One write for the whole listing instead of a print per entry.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def move_up(current_path: str) -> str:
@@ -220,18 +281,8 @@ def get_windows_special_folders() -> Dict[str, str]:
          - Desktop
          - Documents
          - Downloads
+
+    The paths are computed once at import; callers must not modify
+    the returned dictionary.
     """
-    if not utils.is_windows_os():
-        home_dir = os.path.expanduser("~")
-        return {
-            "Desktop": os.path.join(home_dir, "Desktop"),
-            "Documents": os.path.join(home_dir, "Documents"),
-            "Downloads": os.path.join(home_dir, "Downloads"),
-        }
-
-    user_profile = os.environ.get("USERPROFILE", "")
-    return {
-        "Desktop": os.path.join(user_profile, "Desktop"),
-        "Documents": os.path.join(user_profile, "Documents"),
-        "Downloads": os.path.join(user_profile, "Downloads"),
-    }
+    return SPECIAL_FOLDERS
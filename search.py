@@ -1,12 +1,22 @@
 import os
 import re
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Iterator, Set, Tuple
 import utils
 import navigation
 import analysis
 import fnmatch
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor
 import local as lcl
 
+# Characters not allowed in names (the backslash is not in the set,
+# it is the path separator)
+FORBIDDEN_CHARS = frozenset('/:*?"<>|')
+MAX_PATH = 260
+SYSTEM_EXTENSIONS = frozenset(('.exe', '.dll', '.sys'))
+
 def contains_forbidden_chars(name: str) -> bool:
     """
     Check if the filename or path contains forbidden characters.
@@ -17,8 +27,7 @@ def contains_forbidden_chars(name: str) -> bool:
     Returns:
         bool: True if forbidden characters are found, False otherwise.
     """
-    forbidden_chars = r'[\/:*?"<>|]'
-    return re.search(forbidden_chars, name) is not None
+    return not FORBIDDEN_CHARS.isdisjoint(name)
 
 def is_path_too_long(path_str: str) -> bool:
     """
@@ -30,7 +39,7 @@ def is_path_too_long(path_str: str) -> bool:
     Returns:
         bool: True if length exceeds 260 characters, False otherwise.
     """
-    return len(path_str) > 260
+    return len(path_str) > MAX_PATH
 
 def is_hidden_by_dot(name: str) -> bool:
     """
@@ -45,25 +54,129 @@ def is_hidden_by_dot(name: str) -> bool:
     return name.startswith('.')
 
 
-def is_junction_points(path: str) -> bool:
+def _iter_entries(dir_path: str) -> Iterator[Tuple[str, navigation.DirectoryEntry]]:
+    """
+    Yield the searchable entries of a directory.
+
+    Entries with forbidden characters, too long paths, symbolic links
+    and junction points are skipped. The entries carry the type and size
+    read with the listing, so callers do not stat them again.
+
+    Args:
+        dir_path (str): Directory to list.
+
+    Yields:
+        Tuple[str, DirectoryEntry]: Full path and entry.
+    """
+    validity, items = navigation.list_directory(dir_path)
+    if not validity:
+        return
+
+    base = dir_path if dir_path.endswith(os.sep) else dir_path + os.sep
+    max_name = MAX_PATH - len(base)
+    # Bound once per directory instead of a global and attribute lookup
+    # for every entry
+    no_forbidden = FORBIDDEN_CHARS.isdisjoint
+
+    for item in items:
+        name = item.name
+
+        # base is shared by all entries, so the path length check is a
+        # check of the name length.
+        if len(name) > max_name or not no_forbidden(name):
+            continue
+        if item.is_link or item.is_junction:
+            continue
+
+        full_path = base + name
+
+        yield full_path, item
+
+
+def _list_entries(dir_path: str) -> List[Tuple[str, navigation.DirectoryEntry]]:
+    """
+    List the searchable entries of a directory (run in a worker thread).
+
+    Args:
+        dir_path (str): Directory to list.
+
+    Returns:
+        List[Tuple[str, DirectoryEntry]]: Full paths and entries.
+    """
+    return list(_iter_entries(dir_path))
+
+
+def _walk_files(root: str) -> Iterator[Tuple[str, navigation.DirectoryEntry]]:
+    """
+    Yield the searchable files under a directory tree.
+
+    Files come in the order of a recursive walk: the entries of each
+    directory in listing order, descending into a subdirectory where it
+    appears. The tree is walked with an explicit stack, so deep trees do
+    not run into the recursion limit. When a directory has more than
+    PARALLEL_THRESHOLD subdirectories, their listings are read ahead in
+    a thread pool, at most MAX_PENDING at a time. The walk itself stays
+    in one thread, so the order does not depend on thread timing.
+
+    Args:
+        root (str): Root directory of the walk.
+
+    Yields:
+        Tuple[str, DirectoryEntry]: Full path and entry of each file.
     """
-        Check if the given path is a junction point.
+    with ThreadPoolExecutor(max_workers=analysis.MAX_WORKERS) as pool:
+        ahead: Dict[str, Future] = {}
+
+        def listing(dir_path: str) -> List[Tuple[str, navigation.DirectoryEntry]]:
+            future = ahead.pop(dir_path, None)
+            entries = _list_entries(dir_path) if future is None else future.result()
+
+            subdirs = [full_path for full_path, item in entries if item.is_dir]
+            if len(subdirs) > analysis.PARALLEL_THRESHOLD:
+                for full_path in subdirs:
+                    if len(ahead) >= analysis.MAX_PENDING:
+                        break
+                    ahead[full_path] = pool.submit(_list_entries, full_path)
+
+            return entries
+
+        stack = [iter(listing(root))]
+
+        while stack:
+            for full_path, item in stack[-1]:
+                if item.is_dir:
+                    stack.append(iter(listing(full_path)))
+                    break
+                yield full_path, item
+            else:
+                stack.pop()
 
-        Args:
-            path (str): The filesystem path.
 
-        Returns:
-            bool: True if it is a junction point, False otherwise.
+@lru_cache(maxsize=128)
+def _compile_fnmatch(pattern: str, case_sensitive: bool) -> re.Pattern:
     """
-    return os.path.islink(path)
+    Compile a filename pattern to a regular expression.
+
+    Compiled patterns are kept for the session, so repeating a search
+    does not translate the pattern again. Case-insensitive matching uses
+    the regex flag instead of lowering every name.
+
+    Args:
+        pattern (str): The filename pattern.
+        case_sensitive (bool): Match case sensitivity.
+
+    Returns:
+        re.Pattern: Compiled pattern.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags)
+
 
 def find_files_windows(
     pattern: str,
     path: str,
-    case_sensitive: bool = False,
-    current_path: str = None,
-    matched_files: List[str] = None
-) -> List[str]:
+    case_sensitive: bool = False
+) -> Iterator[str]:
     """
     Recursively search for files matching a pattern.
 
@@ -71,52 +184,20 @@ def find_files_windows(
         pattern (str): The filename pattern.
         path (str): The root directory to start search.
         case_sensitive (bool): Match case sensitivity.
-        current_path (str): Current directory in recursion.
-        matched_files (List[str]): Accumulated list of matched files.
 
-    Returns:
-        List[str]: List of matched file paths.
-    """
-    if matched_files is None:
-        matched_files = []
-    if current_path is None:
-        current_path = path
-
-    if case_sensitive:
-        def match_func(name: str, pattern_str: str) -> bool:
-            return fnmatch.fnmatchcase(name, pattern_str)
-    else:
-        def match_func(name: str, pattern_str: str) -> bool:
-            return fnmatch.fnmatchcase(name.lower(), pattern_str.lower())
-
-    try:
-        validity, items = navigation.list_directory(current_path)
-        if not validity:
-            return matched_files
-
-        for item in items:
-            item_path = os.path.join(current_path, item["name"])
-
-            if contains_forbidden_chars(item["name"]) or is_path_too_long(item_path):
-                continue
-
-            if os.path.islink(item_path) or is_junction_points(item_path):
-                continue
-
-            if item["type"] == "folder":
-                find_files_windows(pattern, path, case_sensitive, item_path, matched_files)
-            elif item["type"] == "file":
-                if match_func(item["name"], pattern):
-                    if not is_path_too_long(item_path):
-                        matched_files.append(item_path)
-    except:
-        pass
-    return matched_files
+    Yields:
+        str: Paths of the matched files, as they are found.
+    """
+    match_func = _compile_fnmatch(pattern, case_sensitive).match
+
+    for item_path, item in _walk_files(path):
+        if match_func(item.name):
+            yield item_path
 
 def find_by_windows_extension(
     extensions: List[str],
     path: str
-) -> List[str]:
+) -> Iterator[str]:
     """
     Search files by extensions.
 
@@ -124,11 +205,11 @@ def find_by_windows_extension(
         extensions (List[str]): List of extensions.
         path (str): Directory to search in.
 
-    Returns:
-        List[str]: List of matched files.
+    Yields:
+        str: Paths of the matched files, as they are found.
     """
     if not os.path.exists(path) or not os.path.isdir(path):
-        return []
+        return
 
     normalized_exts = []
     for ext in extensions:
@@ -137,47 +218,20 @@ def find_by_windows_extension(
             ext = '.' + ext
         normalized_exts.append(ext)
 
-    success, stats = analysis.analyze_windows_file_types(path)
-    if not success:
-        return []
-
-    relevant_exts = [ext for ext in normalized_exts if ext in stats and stats[ext]['count'] > 0]
-    if not relevant_exts:
-        return []
-
-    matched_files: List[str] = []
-
-    def recursive_scan(current_dir: str) -> None:
-        try:
-            validity, items = navigation.list_directory(current_dir)
-            if not validity:
-                return
-            for item in items:
-                full_path = os.path.join(current_dir, item["name"])
+    relevant_exts = frozenset(normalized_exts)
 
-                if contains_forbidden_chars(item["name"]) or is_path_too_long(full_path):
-                    continue
-
-                if os.path.islink(full_path) or is_junction_points(full_path):
-                    continue
-
-                if item["type"] == "folder":
-                    recursive_scan(full_path)
-                elif item["type"] == "file":
-                    _, ext = os.path.splitext(item["name"])
-                    if ext.lower() in relevant_exts:
-                        if not is_path_too_long(full_path):
-                            matched_files.append(full_path)
-        except:
-            pass
-
-    recursive_scan(path)
-    return matched_files
+    for full_path, item in _walk_files(path):
+        # Same result as os.path.splitext(): leading dots do not start
+        # an extension.
+        stem = item.name.lstrip('.')
+        dot = stem.rfind('.')
+        if dot >= 0 and stem[dot:].lower() in relevant_exts:
+            yield full_path
 
 def find_large_files_windows(
     min_size_mb: float,
     path: str
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
     Find large files exceeding a size threshold.
 
@@ -185,88 +239,106 @@ def find_large_files_windows(
         min_size_mb (float): Minimum size in megabytes.
         path (str): Directory to search.
 
-    Returns:
-        List[Dict[str, Any]]: List of dictionaries with file info.
+    Yields:
+        Dict[str, Any]: File info of each large file, as it is found.
     """
     min_size_bytes = min_size_mb * 1024 * 1024
-    large_files: List[Dict[str, Any]] = []
 
-    def scan_directory(dir_path: str) -> None:
-        try:
-            validity, items = navigation.list_directory(dir_path)
-            if not validity:
-                return
-            for item in items:
-                full_path = os.path.join(dir_path, item["name"])
+    for full_path, item in _walk_files(path):
+        # The size comes from the listing; count_bytes() walks
+        # directories and reports nothing for a single file.
+        if item.size >= min_size_bytes:
+            yield {
+                'path': full_path,
+                'size_mb': item.size / (1024 * 1024),
+                'size_bytes': item.size,
+                'name': item.name,
+                'type': os.path.splitext(item.name)[1]
+            }
+
+def _system_files_in(dir_path: str) -> List[str]:
+    """
+    Get system files directly inside one directory.
 
-                if contains_forbidden_chars(item["name"]) or is_path_too_long(full_path):
-                    continue
-                if os.path.islink(full_path) or is_junction_points(full_path):
-                    continue
+    Args:
+        dir_path (str): Directory path.
+
+    Returns:
+        List[str]: Paths of the .exe, .dll and .sys files.
+    """
+    system_files: List[str] = []
+
+    # Missing folders give an empty listing, no separate exists check
+    for full_path, item in _iter_entries(dir_path):
+        if not item.is_dir:
+            stem = item.name.lstrip('.')
+            dot = stem.rfind('.')
+            if dot >= 0 and stem[dot:].lower() in SYSTEM_EXTENSIONS:
+                system_files.append(full_path)
+
+    return system_files
 
-                if item["type"] == "file":
-                    try:
-                        size_success, size_bytes = analysis.count_bytes(full_path)
-                        if size_success and size_bytes >= min_size_bytes:
-                            large_files.append({
-                                'path': full_path,
-                                'size_mb': size_bytes / (1024 * 1024),
-                                'size_bytes': size_bytes,
-                                'name': os.path.basename(full_path),
-                                'type': os.path.splitext(full_path)[1]
-                            })
-                    except:
-                        pass
-                elif item["type"] == "folder":
-                    scan_directory(full_path)
-        except:
-            pass
-
-    scan_directory(path)
-    return large_files
 
 def find_windows_system_files(path: str) -> List[str]:
     """
     Get system files in Windows directories.
 
+    The folders are independent, so they are listed concurrently.
+
     Args:
         path (str): Directory path.
 
     Returns:
         List[str]: List of system files.
     """
-    system_files: List[str] = []
-
     special_dirs = navigation.get_windows_special_folders()
-    search_dirs = [
+    candidates = [
         special_dirs.get('Desktop', ''),
         special_dirs.get('Documents', ''),
         special_dirs.get('Downloads', ''),
         path
     ]
 
-    sys_extensions = ['.exe', '.dll', '.sys']
-    for dir_path in search_dirs:
-        if not dir_path or not os.path.exists(dir_path):
+    # The current folder is often one of the special folders; each
+    # directory is listed only once.
+    search_dirs: List[str] = []
+    seen: Set[str] = set()
+    for dir_path in candidates:
+        if not dir_path:
             continue
-        try:
-            with os.scandir(dir_path) as entries:
-                for entry in entries:
-                    full_path = os.path.join(dir_path, entry.name)
-
-                    if contains_forbidden_chars(entry.name) or is_path_too_long(full_path):
-                        continue
-                    if os.path.islink(full_path) or is_junction_points(full_path):
-                        continue
-
-                    if entry.is_file():
-                        ext = os.path.splitext(entry.name)[1].lower()
-                        if ext in sys_extensions:
-                            system_files.append(full_path)
-        except:
-            pass
+        key = os.path.normcase(os.path.abspath(dir_path))
+        if key not in seen:
+            seen.add(key)
+            search_dirs.append(dir_path)
+
+    if not search_dirs:
+        return []
+
+    # Each task returns its own list, and map() keeps the folder order
+    with ThreadPoolExecutor(max_workers=len(search_dirs)) as pool:
+        results = pool.map(_system_files_in, search_dirs)
+        return list(chain.from_iterable(results))
+
+
+def _write_lines(lines: List[str]) -> None:
+    """
+    Write result lines to the console in a single call.
+
+    Args:
+        lines (List[str]): Lines without trailing newlines.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    return system_files
+
+def _print_paths(files: List[str]) -> None:
+    """
+    Print found files as "name - path" lines.
+
+    Args:
+        files (List[str]): Full paths of the files.
+    """
+    _write_lines([f"  {os.path.basename(f)} - {f}" for f in files])
 
 
 def search_menu_handler(current_path: str) -> bool:
@@ -299,20 +371,22 @@ def search_menu_handler(current_path: str) -> bool:
                 except:
                     print(f'{lcl.CORRECT_NUMER}')
                     continue
-                files = find_large_files_windows(size_mb, current_path)
+                # The count heads the output, so the results are collected
+                files = list(find_large_files_windows(size_mb, current_path))
                 print(f"\n{lcl.FIND} {len(files)} {lcl.FILES_MORE} {size_mb} {lcl.M_B}")
                 if files:
                     print(f"{f'{lcl.FILE_NAME}':<40} {f'{lcl.SIZE}':<12} {f'{lcl.TYPE}':<10}")
                     print("-" * 70)
-                    for f in files:
-                        print(f"{f['name']:<40} {f['size_mb']:<12.2f} {f['type']:<10}")
+                    _write_lines([
+                        f"{f['name']:<40} {f['size_mb']:<12.2f} {f['type']:<10}"
+                        for f in files
+                    ])
                 else:
                     print(f'{lcl.NOT_FILES}')
             case '2':
                 sys_files = find_windows_system_files(current_path)
-                print(f"\n{lcl.SYSTEM_FILES} {len(sys_files)}")
-                for f in sys_files:
-                    print(f"  {os.path.basename(f)} - {f}")
+                print(f"\n{lcl.SYSTEM_FILES_FOUND} {len(sys_files)}")
+                _print_paths(sys_files)
             case '3':
                 print(f"\n{lcl.SHOW_STATISTIC}")
                 analysis.show_windows_directory_stats(current_path)
@@ -320,10 +394,9 @@ def search_menu_handler(current_path: str) -> bool:
                 exts_input = input(f'{lcl.EX_INPUT}').strip()
                 if exts_input:
                     extensions = [ext.strip() for ext in exts_input.split(',')]
-                    files = find_by_windows_extension(extensions, current_path)
+                    files = list(find_by_windows_extension(extensions, current_path))
                     print(f"\n{lcl.FIND} {len(files)} {lcl.FILES_SIZE} {extensions}:")
-                    for f in files:
-                        print(f"  {os.path.basename(f)} - {f}")
+                    _print_paths(files)
                 else:
                     print(f'{lcl.NOT_SIZE}')
             case '5':
@@ -331,10 +404,9 @@ def search_menu_handler(current_path: str) -> bool:
                 if pattern:
                     case_sensitive = input(f'{lcl.REG_SENS}').strip().lower()
                     is_case_sensitive = case_sensitive in [f'{lcl.YES}', f'{lcl.LETTER}', 'yes', 'y']
-                    files = find_files_windows(pattern, current_path, is_case_sensitive)
+                    files = list(find_files_windows(pattern, current_path, is_case_sensitive))
                     print(f"\n{lcl.FIND} {len(files)} {lcl.FILES_SAMPLE} '{pattern}':")
-                    for f in files:
-                        print(f"  {os.path.basename(f)} - {f}")
+                    _print_paths(files)
                 else:
                     print(f'{lcl.NOT_SAMPLE}')
             case '6':
@@ -368,6 +440,7 @@ def format_windows_search_results(results: List[Dict[str, Any]],
     print(f"{lcl.FILE_NAME:<40} {lcl.SIZE:<15} {lcl.P:<30}")
     print("-" * 80)
 
+    lines = []
     for item in results:
         name = item.get('name', f'{lcl.NOT_NAME }')
         size_bytes = item.get('size_bytes', item.get('size', 0))
@@ -375,7 +448,9 @@ def format_windows_search_results(results: List[Dict[str, Any]],
 
         size_str = utils.format_size(size_bytes)  # форматируем размер через utils
 
-        print(f"{name:<40} {size_str:<15} {path:<30}")
+        lines.append(f"{name:<40} {size_str:<15} {path:<30}")
+
+    _write_lines(lines)
 
     print("=" * 80)
     print(f"{lcl.ALL_FIND} {len(results)} {lcl.FILES_2}\n")
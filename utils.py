@@ -1,12 +1,56 @@
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, List, Tuple
 import re
+import string
 import local as lcl
 
 PathString = Union[str, Path]
 
+DRIVE_LETTERS = frozenset(string.ascii_letters)
+
+# The platform does not change while the program runs
+IS_WINDOWS = platform.system() == "Windows"
+
+FILE_ATTRIBUTE_HIDDEN = 0x02
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+SIZE_DIVISORS = (1.0, 1024.0, 1024.0 ** 2, 1024.0 ** 3, 1024.0 ** 4, 1024.0 ** 5)
+# format_size() reports everything from 1 TB up in TB
+TB_INDEX = SIZE_UNITS.index("TB")
+
+DUP_SEP_RE = re.compile(r'[\\/]{2,}')
+UNC_PREFIX_RE = re.compile(r'^(\\\\[^\\/]+[\\/])(.*)')
+
+# Kept as strings as well as sets: messages list the characters in
+# this order.
+FORBIDDEN_PATH_CHARS = '<>:"|?*'
+FORBIDDEN_PATH_SET = frozenset(FORBIDDEN_PATH_CHARS)
+NOT_RECOMMENDED_CHARS = "$%&'+,;=@[]^`{}~"
+NOT_RECOMMENDED_SET = frozenset(NOT_RECOMMENDED_CHARS)
+
+RESERVED_NAMES_ORDERED = (
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+)
+RESERVED_NAMES = frozenset(RESERVED_NAMES_ORDERED)
+RESERVED_FIRST_CHARS = frozenset('CPANLcpanl')
+
+
+def _is_drive(p_str: str) -> bool:
+    """Checks whether a string is a bare drive such as "C:".
+
+    Args:
+        p_str (str): String to check.
+
+    Returns:
+        bool: True for a drive letter followed by a colon.
+    """
+
+    return len(p_str) == 2 and p_str[1] == ':' and p_str[0] in DRIVE_LETTERS
+
 
 def is_windows_os() -> bool:
     """Checks whether current OS is Windows.
@@ -18,9 +62,10 @@ def is_windows_os() -> bool:
         bool: True if the OS is Windows, False otherwise
     """
 
-    return platform.system() == "Windows"
+    return IS_WINDOWS
 
 
+@lru_cache(maxsize=4096)
 def validate_windows_path(path: PathString) -> Tuple[bool, str]:
     """Validates a Windows file system path according to Windows rules.
     Performs checks for:
@@ -34,6 +79,8 @@ def validate_windows_path(path: PathString) -> Tuple[bool, str]:
     - Mixed or duplicate separators
     - NTFS discouraged characters
 
+    The result depends only on the path string, so it is memoized.
+
     Args:
         path (str | Path): Path to validate.
 
@@ -43,58 +90,60 @@ def validate_windows_path(path: PathString) -> Tuple[bool, str]:
             str: Validation result message.
     """
 
-    p_str = str(path)
+    p_str = os.fspath(path)
 
     if not p_str.strip():
         return False, "Путь не может быть пустым"
 
-    disk_match = re.match(r'^([A-Za-z]):', p_str)
+    # A drive prefix is always the two characters "X:", so detecting it
+    # also validates its format.
+    has_disk = _is_drive(p_str[:2])
     remaining_path = p_str
 
-    if disk_match:
-        disk_prefix = disk_match.group(0)
-        remaining_path = p_str[len(disk_prefix):]
-
-        if not re.match(r'^[A-Za-z]:$', disk_prefix):
-            return False, f"{lcl.INCORRECT1}: {disk_prefix}"
+    if has_disk:
+        remaining_path = p_str[2:]
 
     elif p_str.startswith('\\'):
         if p_str.startswith('\\\\'):
             if len(p_str) < 4 or '\\' not in p_str[2:]:
                 return False, f'{lcl.INCORRECT2}'
 
-
-    forbidden_chars = ['<', '>', ':', '"', '|', '?', '*']
-
     colon_count = p_str.count(':')
     if colon_count > 1:
         return False, f'{lcl.COLON1}'
 
-    if colon_count == 1 and not disk_match:
+    if colon_count == 1 and not has_disk:
         return False, f'{lcl.COLON2}'
-    for char in forbidden_chars:
-        if char in remaining_path:
-            return False, f"{lcl.SYMBOL} : {char}"
+    # One pass over the path; the order is only needed on failure
+    if not FORBIDDEN_PATH_SET.isdisjoint(remaining_path):
+        char = next(c for c in FORBIDDEN_PATH_CHARS if c in remaining_path)
+        return False, f"{lcl.SYMBOL} : {char}"
 
-    reserved_names = [
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    ]
+    normalized = remaining_path.replace('/', '\\')
+    path_parts = [part for part in normalized.split('\\') if part]
 
-    path_parts = [part for part in re.split(r'[\\/]+', remaining_path) if part]
+    # A part ends with a dot or space, or starts with a space, exactly
+    # when one of these pairs occurs in the separator-wrapped path, so
+    # three scans of the whole path replace the per-part checks for the
+    # usual valid path.
+    wrapped = '\\' + normalized + '\\'
+    check_part_ends = '.\\' in wrapped or ' \\' in wrapped or '\\ ' in wrapped
 
     for part in path_parts:
-        name_without_ext = os.path.splitext(part)[0].upper()
-        if name_without_ext in reserved_names:
-            return False, f"{lcl.NAME1} : {part}"
-
-        if part.endswith('.'):
-            return False, f'{lcl.NAME2}'
-        if part.endswith(' '):
-            return False, f'{lcl.NAME3}'
-        if part.startswith(' '):
-            return False, f'{lcl.NAME4}'
+        # Device names stay reserved with any extension (NUL.tar.gz),
+        # so the name is cut at the first dot. Most parts are ruled
+        # out by the first letter already.
+        if part[0] in RESERVED_FIRST_CHARS:
+            if part.partition('.')[0].upper() in RESERVED_NAMES:
+                return False, f"{lcl.NAME1} : {part}"
+
+        if check_part_ends:
+            if part.endswith('.'):
+                return False, f'{lcl.NAME2}'
+            if part.endswith(' '):
+                return False, f'{lcl.NAME3}'
+            if part.startswith(' '):
+                return False, f'{lcl.NAME4}'
 
     if p_str.startswith('\\\\?\\'):
         if len(p_str) > 32767:
@@ -108,26 +157,22 @@ def validate_windows_path(path: PathString) -> Tuple[bool, str]:
 
     if p_str.startswith('\\\\?\\'):
         path_after_prefix = p_str[4:]
-        if re.search(r'[\\/]{2,}', path_after_prefix):
+        if DUP_SEP_RE.search(path_after_prefix):
             return False, f'{lcl.SEPARATOR2}'
     elif p_str.startswith('\\\\'):
-        match = re.match(r'^(\\\\[^\\/]+[\\/])(.*)', p_str)
+        match = UNC_PREFIX_RE.match(p_str)
         if match:
             prefix, rest = match.groups()
-            if re.search(r'[\\/]{2,}', rest):
+            if DUP_SEP_RE.search(rest):
                 return False, f'{lcl.SEPARATOR3}'
     else:
-        if re.search(r'[\\/]{2,}', p_str):
+        if DUP_SEP_RE.search(p_str):
             return False, f'{lcl.SEPARATOR2}'
 
-    not_recommended_chars = ['$', '%', '&', "'", '+', ',', ';', '=',
-                             '@','[', ']', '^', '`', '{', '}', '~']
-    found_not_recommended = []
-    for char in not_recommended_chars:
-        if char in remaining_path:
-            found_not_recommended.append(char)
+    found = NOT_RECOMMENDED_SET.intersection(remaining_path)
 
-    if found_not_recommended:
+    if found:
+        found_not_recommended = [c for c in NOT_RECOMMENDED_CHARS if c in found]
         warning = (f'{lcl.SYMBOLS}', f"{', '.join(found_not_recommended)})")
         return True, f'{lcl.VALID}' + f"{warning}"
 
@@ -144,22 +189,13 @@ def format_size(size_bytes: int) -> str:
         str: Formatted size string (b, kb, mb, gb, tb)
     """
 
-    if size_bytes < 1024:
+    # Units are powers of 1024, so the bit length picks the unit
+    unit_index = min(max(0, (size_bytes.bit_length() - 1) // 10), TB_INDEX)
+
+    if unit_index == 0:
         return f"{size_bytes} B"
 
-    kb = 1024
-    mb = kb * 1024
-    gb = mb * 1024
-    tb = gb * 1024
-
-    if size_bytes < mb:
-        return f"{size_bytes / kb:.1f} KB"
-    elif size_bytes < gb:
-        return f"{size_bytes / mb:.1f} MB"
-    elif size_bytes < tb:
-        return f"{size_bytes / gb:.1f} GB"
-    else:
-        return f"{size_bytes / tb:.1f} TB"
+    return f"{size_bytes / SIZE_DIVISORS[unit_index]:.1f} {SIZE_UNITS[unit_index]}"
 
 
 def get_parent_path(path: PathString) -> str:
@@ -173,14 +209,12 @@ def get_parent_path(path: PathString) -> str:
         str: Parent directory path.
     """
 
-    p_str = str(path)
+    p_str = os.fspath(path)
     parent = os.path.dirname(p_str)
 
-    if platform.system() == "Windows":
-        if re.match(r'^[A-Za-z]:$', parent):
+    if IS_WINDOWS:
+        if _is_drive(parent):
             parent = parent + '\\'
-        elif re.match(r'^[A-Za-z]:\\$', parent):
-            pass
     elif os.path.splitdrive(parent)[1] == "":
         parent = os.path.join(parent, "")
 
@@ -200,57 +234,68 @@ def safe_windows_listdir(path: PathString) -> List[str]:
     """
 
     try:
-        p_str = str(path)
+        p_str = os.fspath(path)
         return os.listdir(p_str)
     except (PermissionError, FileNotFoundError, OSError):
         return []
 
 
-def is_hidden_windows_file(path: PathString) -> bool:
-    """Determines whether a file is hidden.
+def is_hidden_from_entry(entry: os.DirEntry) -> bool:
+    """Determines whether a directory entry is hidden.
 
-    On Windows uses WinAPI FILE_ATTRIBUTE_HIDDEN.
-    On Unix-like systems checks for leading dot.
+    On Windows reads FILE_ATTRIBUTE_HIDDEN from the stat data cached in
+    the entry, falling back to the leading-dot rule if it cannot be read.
+    On Unix-like systems checks for leading dot without a stat call.
 
     Args:
-        path (str | Path): File path.
+        entry (os.DirEntry): Entry returned by os.scandir().
 
     Returns:
-        bool: True if file is hidden, otherwise False.
+        bool: True if the entry is hidden, otherwise False.
     """
 
-    p_str = str(path)
+    if IS_WINDOWS:
+        try:
+            attrs = entry.stat(follow_symlinks=False).st_file_attributes
+        except OSError:
+            return entry.name.startswith('.')
 
-    if not Path(p_str).exists():
-        return False
+        return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
+
+    return entry.name.startswith('.')
 
-    if platform.system() == "Windows":
-        try:
-            import ctypes
-            from ctypes import wintypes
 
-            file_attribute_hidden = 0x02
+def is_hidden_windows_file(path: PathString) -> bool:
+    """Determines whether a file is hidden.
 
-            GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
-            GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
-            GetFileAttributesW.restype = wintypes.DWORD
+    On Windows reads FILE_ATTRIBUTE_HIDDEN from os.stat().st_file_attributes.
+    On Unix-like systems checks for leading dot.
 
-            attrs = GetFileAttributesW(p_str)
+    Args:
+        path (str | Path): File path.
 
-            if attrs == 0xFFFFFFFF:
-                last_error = ctypes.windll.kernel32.GetLastError()
-                error_access_denied = 5
+    Returns:
+        bool: True if file is hidden, otherwise False.
+    """
 
-                if last_error == error_access_denied:
-                    return True
-                return False
+    p_str = os.fspath(path)
 
-            return bool(attrs & file_attribute_hidden)
+    if IS_WINDOWS:
+        # A missing path also fails here, so no separate existence
+        # check is needed.
+        try:
+            attrs = os.stat(p_str, follow_symlinks=False).st_file_attributes
+        except PermissionError:
+            # Protected system files deny access; they count as hidden
+            return True
+        except OSError:
+            return False
 
-        except Exception:
-            pass
+        return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
 
-    return os.path.basename(p_str).startswith('.')
+    # The existence check is only needed for dot names
+    name_start = p_str.rfind(os.sep) + 1
+    return p_str.startswith('.', name_start) and os.path.exists(p_str)
 
 
 def get_windows_reserved_names() -> List[str]:
@@ -265,20 +310,20 @@ def get_windows_reserved_names() -> List[str]:
         list: Reserved Windows filenames.
     """
 
-    return [
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    ]
+    return list(RESERVED_NAMES_ORDERED)
 
 
+@lru_cache(maxsize=4096)
 def normalize_windows_path(path: str) -> str:
     """Normalizes a Windows path.
 
     - Converts forward slashes to backslashes
-    - Removes duplicate separators
+    - Removes duplicate separators, keeping the leading double
+      backslash of UNC and \\\\?\\ paths
     - Removes trailing backslash unless path is drive root
 
+    The result depends only on the input, so it is memoized.
+
     Args:
         path (str): Input path.
 
@@ -288,9 +333,21 @@ def normalize_windows_path(path: str) -> str:
 
     path = path.replace('/', '\\')
 
-    path = re.sub(r'\\\\+', '\\', path)
+    if path.startswith('\\\\'):
+        # UNC and \\?\ paths keep their prefix; only the separators
+        # after it are collapsed.
+        prefix, path = '\\\\', path.lstrip('\\')
+        if path.startswith('?\\'):
+            prefix, path = '\\\\?\\', path[2:].lstrip('\\')
+    else:
+        prefix = ''
+
+    # Each pass halves every run of backslashes; paths without
+    # duplicates are scanned once.
+    while '\\\\' in path:
+        path = path.replace('\\\\', '\\')
 
-    if path.endswith('\\') and not re.match(r'^[A-Za-z]:\\$', path):
-        path = path.rstrip('\\')
+    if path.endswith('\\') and not (len(path) == 3 and _is_drive(path[:2])):
+        path = path[:-1]
 
-    return path
+    return prefix + path